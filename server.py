@@ -1,13 +1,31 @@
 import os
+import re
+import sys
+import asyncio
+import functools
 import json
+import time
+import threading
 from typing import Optional
+from collections import OrderedDict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from fastmcp import FastMCP
 from fastmcp.resources import FileResource
 from dotenv import load_dotenv
 
+try:
+    # Optional: faster item counting for large paginated responses
+    import simdjson
+except ImportError:
+    simdjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -113,32 +131,142 @@ def refresh_access_token(refresh_token: str, client_id: str, client_secret: str,
 
     response = requests.post(url, data=data, timeout=30)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
+
+# Cached token data and its expiry, shared by all API calls.
+# expires_ts is a Unix timestamp parsed once per token, in _cache_token(),
+# so checking the token is a plain float comparison against time.time().
+TOKEN_EXPIRY_SKEW = 60  # seconds
+_TOKEN_CACHE = {"token": None, "expires_ts": None}
+_TOKEN_LOCK = threading.Lock()
 
 
-def get_valid_token() -> str:
+def _parse_expires_at(expires_at_str: str) -> float:
     """
-    Get a valid access token, refreshing if necessary.
+    Parse an ISO 8601 expires_at value into a Unix timestamp.
+
+    Args:
+        expires_at_str: Expiry timestamp, e.g. "2025-12-31T23:59:59Z"
 
     Returns:
-        Valid access token string
+        Expiry as seconds since the epoch
+    """
+    # datetime.fromisoformat() only accepts a trailing 'Z' from Python 3.11
+    if sys.version_info < (3, 11):
+        expires_at_str = expires_at_str.replace('Z', '+00:00')
+    return datetime.fromisoformat(expires_at_str).timestamp()
+
+
+def _cache_token(token_data: dict) -> None:
     """
-    token_data = load_token()
-    access_token = token_data.get("access_token")
+    Store token data and its parsed expiry in _TOKEN_CACHE.
 
-    # Check if token is expired
+    Args:
+        token_data: Dictionary containing token information
+    """
     expires_at_str = token_data.get("expires_at")
-    if expires_at_str:
-        expires_at = datetime.fromisoformat(expires_at_str.replace('Z', '+00:00'))
-        if datetime.now(expires_at.tzinfo) >= expires_at:
-            # Token is expired, refresh it
+    try:
+        expires_ts = _parse_expires_at(expires_at_str) if expires_at_str else None
+    except (TypeError, ValueError):
+        # Unreadable expiry: treat the token as expired so it gets refreshed
+        expires_ts = 0.0
+
+    _TOKEN_CACHE["token"] = token_data
+    _TOKEN_CACHE["expires_ts"] = expires_ts
+
+
+def _cached_token(stale_token: Optional[str] = None) -> Optional[str]:
+    """
+    Return the cached access token if it is not close to expiring.
+
+    Args:
+        stale_token: An access token the API rejected; it is never returned
+
+    Returns:
+        The cached access token, or None if it must be loaded or refreshed
+    """
+    token_data = _TOKEN_CACHE["token"]
+    if not token_data or token_data.get("access_token") == stale_token:
+        return None
+
+    expires_ts = _TOKEN_CACHE["expires_ts"]
+    if expires_ts is not None and time.time() >= expires_ts - TOKEN_EXPIRY_SKEW:
+        return None
+
+    return token_data.get("access_token")
+
+
+def can_refresh_token() -> bool:
+    """
+    Check whether the OAuth credentials needed to refresh the token are set.
+
+    Returns:
+        True if a token refresh can be attempted
+    """
+    token_data = _TOKEN_CACHE["token"] or {}
+    return all([
+        os.getenv("BASECAMP_CLIENT_ID", ""),
+        os.getenv("BASECAMP_CLIENT_SECRET", ""),
+        os.getenv("BASECAMP_REDIRECT_URI", ""),
+        token_data.get("refresh_token")
+    ])
+
+
+def get_valid_token(stale_token: Optional[str] = None) -> str:
+    """
+    Get a valid access token, refreshing if necessary.
+
+    The token and its parsed expiry are cached in _TOKEN_CACHE. The token is
+    only loaded when nothing usable is cached, and is refreshed once it is
+    within TOKEN_EXPIRY_SKEW of expiring.
+
+    Args:
+        stale_token: An access token the API just rejected with 401. If it is
+                     still the current token, it is refreshed even if it has
+                     not expired yet.
+
+    Returns:
+        Valid access token string
+    """
+    access_token = _cached_token(stale_token)
+    if access_token:
+        return access_token
+
+    with _TOKEN_LOCK:
+        # Another thread may have refreshed the token while we waited
+        access_token = _cached_token(stale_token)
+        if access_token:
+            return access_token
+
+        # Load the token if none is cached, or if a file-based token was
+        # rejected (token.json may have been updated outside this process)
+        token_data = _TOKEN_CACHE["token"]
+        if (not token_data or not token_data.get("access_token")
+                or (stale_token and token_data.get("source") == "file")):
+            token_data = load_token()
+            _cache_token(token_data)
+        access_token = token_data.get("access_token")
+
+        # Check if token is expired or about to expire
+        expires_ts = _TOKEN_CACHE["expires_ts"]
+        now = time.time()
+        expired = expires_ts is not None and now >= expires_ts
+        expiring = expires_ts is not None and now >= expires_ts - TOKEN_EXPIRY_SKEW
+        rejected = bool(stale_token) and access_token == stale_token
+
+        if expiring or rejected:
+            # Token is expiring or was rejected, refresh it
             client_id = os.getenv("BASECAMP_CLIENT_ID", "")
             client_secret = os.getenv("BASECAMP_CLIENT_SECRET", "")
             redirect_uri = os.getenv("BASECAMP_REDIRECT_URI", "")
             refresh_token = token_data.get("refresh_token")
 
             if not all([client_id, client_secret, redirect_uri, refresh_token]):
-                raise ValueError("Missing OAuth credentials for token refresh")
+                if expired or rejected:
+                    raise ValueError("Missing OAuth credentials for token refresh")
+                # Can't refresh early; keep using the token until it expires
+                return access_token
 
             # Refresh the token
             new_token_data = refresh_access_token(refresh_token, client_id, client_secret, redirect_uri)
@@ -152,9 +280,11 @@ def get_valid_token() -> str:
             })
             save_token(token_data)  # Will only save to file if source != "environment"
             access_token = new_token_data.get("access_token")
+            _cache_token(token_data)
+            _headers_for_bucket.cache_clear()
 
-    if not access_token:
-        raise ValueError("No access token found in token.json")
+        if not access_token:
+            raise ValueError("No access token found in token.json")
 
     return access_token
 
@@ -163,88 +293,459 @@ def get_valid_token() -> str:
 BASECAMP_ACCOUNT_ID = os.getenv("BASECAMP_ACCOUNT_ID", "")
 USER_AGENT = os.getenv("USER_AGENT", "Basecamp MCP Server")
 
-# Try to load account ID from token file if not in env
+# Try to load account ID from token file if not in env.
+# The loaded token seeds _TOKEN_CACHE so the first API call doesn't load it again.
 if not BASECAMP_ACCOUNT_ID:
-    token_data = load_token()
-    BASECAMP_ACCOUNT_ID = token_data.get("account_id", "")
+    _cache_token(load_token())
+    BASECAMP_ACCOUNT_ID = _TOKEN_CACHE["token"].get("account_id", "")
 
 if not BASECAMP_ACCOUNT_ID:
     raise ValueError("BASECAMP_ACCOUNT_ID not found in environment or token.json")
 
 BASECAMP_API_BASE_URL = f"https://3.basecampapi.com/{BASECAMP_ACCOUNT_ID}"
 
+# URL templates for the Basecamp API endpoints used by the tools
+_PROJECTS_URL = BASECAMP_API_BASE_URL + "/projects.json"
+_PROJECT_URL = BASECAMP_API_BASE_URL + "/projects/{project_id}.json"
+_TODOSET_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/todosets/{todoset_id}.json"
+_TODOLISTS_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/todosets/{todoset_id}/todolists.json"
+_TODOLIST_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/todolists/{todolist_id}.json"
+_BUCKET_TODOLISTS_PREFIX = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/todolists/"
+_TODOS_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/todolists/{todolist_id}/todos.json"
+_TODO_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/todos/{todo_id}.json"
+_TODO_COMPLETION_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/todos/{todo_id}/completion.json"
+_PEOPLE_URL = BASECAMP_API_BASE_URL + "/people.json"
+_COMMENTS_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/recordings/{recording_id}/comments.json"
+_COMMENT_URL = BASECAMP_API_BASE_URL + "/buckets/{bucket_id}/comments/{comment_id}.json"
+
+# Shared HTTP session for all Basecamp API calls.
+# Reusing one session keeps connections to 3.basecampapi.com alive between
+# requests instead of paying a new TCP + TLS handshake on every call.
+#
+# Rate limits (429) and transient server errors are retried inside the
+# adapter with exponential backoff, honoring Retry-After, so a paginated
+# fetch doesn't lose the pages it already has. POST is left out because
+# creating a to-do or comment is not idempotent. After the last retry the
+# final response is returned, so raise_for_status() still reports it.
+HTTP_POOL_MAXSIZE = 20
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+SESSION.headers.update({'User-Agent': USER_AGENT})
+
+# Pagination settings. FETCH_MAX_WORKERS must not exceed HTTP_POOL_MAXSIZE,
+# or pooled connections get discarded instead of reused.
+FETCH_MAX_WORKERS = 8
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+_LAST_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="last"')
+_PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)')
+
+
+# How long a built Authorization header is reused. This must stay below
+# TOKEN_EXPIRY_SKEW so a cached header never outlives its token.
+HEADERS_CACHE_SECONDS = 30
 
-def get_basecamp_headers() -> dict:
+
+@functools.lru_cache(maxsize=4)
+def _headers_for_bucket(bucket: int) -> dict:
     """
-    Get the required headers for Basecamp API requests.
+    Build the authorization header for one HEADERS_CACHE_SECONDS time bucket.
+
+    Callers must not mutate the returned dict; it is shared.
+
+    Args:
+        bucket: int(time.time()) // HEADERS_CACHE_SECONDS
+
+    Returns:
+        Dictionary containing the authorization header
+    """
+    return {'Authorization': f'Bearer {get_valid_token()}'}
+
+
+def get_basecamp_headers(stale_token: Optional[str] = None) -> dict:
+    """
+    Get the per-request headers for Basecamp API requests.
     Automatically refreshes the token if expired.
 
+    The User-Agent header is set once on SESSION, and the authorization
+    header is reused for up to HEADERS_CACHE_SECONDS.
+
+    Args:
+        stale_token: An access token the API rejected, forcing a refresh
+
     Returns:
-        Dictionary containing authorization and user agent headers
+        Dictionary containing the authorization header
     """
-    access_token = get_valid_token()
+    if stale_token:
+        get_valid_token(stale_token)
+        _headers_for_bucket.cache_clear()
 
-    return {
-        'Authorization': f'Bearer {access_token}',
-        'User-Agent': USER_AGENT,
-        'Content-Type': 'application/json'
-    }
+    return _headers_for_bucket(int(time.time()) // HEADERS_CACHE_SECONDS)
 
 
-def fetch_all_pages(url: str) -> list:
+def basecamp_request(
+    method: str,
+    url: str,
+    payload: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    **kwargs
+) -> requests.Response:
     """
-    Fetch all pages of a paginated Basecamp API endpoint.
+    Send an authenticated request to the Basecamp API on the shared SESSION.
+
+    A payload is encoded once with orjson and sent as the raw request body
+    with an explicit JSON Content-Type. If Basecamp rejects the access token
+    with 401 and a refresh is possible, the token is refreshed and the
+    request is retried once; otherwise the 401 response is returned.
+
+    Args:
+        method: HTTP method ("GET", "POST", "PUT" or "DELETE")
+        url: The API endpoint URL
+        payload: Optional JSON request body
+        headers: Optional extra headers for this request
+        **kwargs: Extra arguments for SESSION.request
+
+    Returns:
+        The API response
+    """
+    if payload is not None:
+        kwargs["data"] = orjson.dumps(payload)
+        headers = {'Content-Type': 'application/json', **(headers or {})}
+
+    auth_headers = get_basecamp_headers()
+    response = SESSION.request(method, url, headers={**auth_headers, **(headers or {})}, timeout=30, **kwargs)
+
+    if response.status_code == 401 and can_refresh_token():
+        rejected_token = auth_headers['Authorization'].removeprefix('Bearer ')
+        auth_headers = get_basecamp_headers(stale_token=rejected_token)
+        response = SESSION.request(method, url, headers={**auth_headers, **(headers or {})}, timeout=30, **kwargs)
+
+    return response
+
+
+# Short-lived cache for single-resource GETs: url -> (expires_at, etag, body)
+GET_CACHE_TTL = 30
+GET_CACHE_MAX_ENTRIES = 256
+_GET_CACHE = OrderedDict()
+_GET_CACHE_LOCK = threading.Lock()
+
+
+def cached_get(url: str, ttl: float = GET_CACHE_TTL) -> bytes:
+    """
+    GET a single Basecamp resource through a small in-process TTL cache.
+
+    Fresh entries are returned without hitting the API. Stale entries are
+    revalidated with If-None-Match, and a 304 response reuses the cached body.
+    The least recently used entries are evicted past GET_CACHE_MAX_ENTRIES.
+
+    Args:
+        url: The API endpoint URL
+        ttl: Seconds a response stays fresh
+
+    Returns:
+        The response body as bytes
+    """
+    with _GET_CACHE_LOCK:
+        entry = _GET_CACHE.get(url)
+        if entry:
+            _GET_CACHE.move_to_end(url)
+
+    if entry and time.monotonic() < entry[0]:
+        return entry[2]
+
+    headers = {'If-None-Match': entry[1]} if entry and entry[1] else None
+    response = basecamp_request("GET", url, headers=headers)
+
+    if response.status_code == 304 and entry:
+        etag, body = entry[1], entry[2]
+    else:
+        response.raise_for_status()
+        etag, body = response.headers.get('ETag', ''), response.content
+
+    with _GET_CACHE_LOCK:
+        _GET_CACHE[url] = (time.monotonic() + ttl, etag, body)
+        _GET_CACHE.move_to_end(url)
+        while len(_GET_CACHE) > GET_CACHE_MAX_ENTRIES:
+            _GET_CACHE.popitem(last=False)
+
+    return body
+
+
+def invalidate_cached(*urls: str) -> None:
+    """
+    Drop cached GET responses that a write has made stale.
+
+    Args:
+        *urls: The API endpoint URLs to forget
+    """
+    with _GET_CACHE_LOCK:
+        for url in urls:
+            _GET_CACHE.pop(url, None)
+
+
+def invalidate_cached_prefix(prefix: str) -> None:
+    """
+    Drop every cached GET response whose URL starts with prefix.
+
+    Args:
+        prefix: URL prefix, e.g. all to-do lists of one bucket
+    """
+    with _GET_CACHE_LOCK:
+        for url in [url for url in _GET_CACHE if url.startswith(prefix)]:
+            del _GET_CACHE[url]
+
+
+# Tool responses are read by MCP clients and agents, so they are compact
+# unless BASECAMP_PRETTY=1 asks for indented output.
+_PRETTY = os.getenv("BASECAMP_PRETTY") == "1"
+
+
+def _dump(obj) -> str:
+    """
+    Serialize a tool response to a JSON string.
+
+    Output is compact unless BASECAMP_PRETTY=1 is set.
+
+    Args:
+        obj: The JSON-serializable response object
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _PRETTY else 0).decode()
+
+
+def _dump_raw(body: bytes) -> str:
+    """
+    Return an already-encoded JSON body as a tool response string.
+
+    The body is passed through as-is unless BASECAMP_PRETTY=1 is set,
+    in which case it is re-indented.
+
+    Args:
+        body: Raw JSON bytes
+
+    Returns:
+        JSON string
+    """
+    if _PRETTY:
+        return _dump(orjson.loads(body))
+    return body.decode()
+
+
+def _page_url(url: str, page: int) -> str:
+    """
+    Return the given URL with its ?page= query parameter set to page.
+
+    Args:
+        url: A Basecamp API URL, with or without a query string
+        page: The page number to request
+
+    Returns:
+        URL for the requested page
+    """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def fetch_page_responses(url: str, concurrent: bool = True) -> list:
+    """
+    Fetch the raw responses for every page of a paginated Basecamp endpoint.
 
     Uses the Link header to follow pagination as per Basecamp API guidelines.
-    Stops when the Link header is empty.
+    When the first page advertises a rel="last" link, the remaining pages are
+    fetched concurrently on the shared SESSION; otherwise rel="next" links are
+    followed one by one until the Link header is empty.
 
     Args:
         url: The initial API endpoint URL
+        concurrent: Set to False to always fetch pages one by one, e.g. when
+                    the caller already runs several fetches in parallel
+
+    Returns:
+        List of responses, one per page, in page order
+    """
+    def get_page(page_url: str) -> requests.Response:
+        response = basecamp_request("GET", page_url)
+        response.raise_for_status()
+        return response
+
+    try:
+        response = get_page(url)
+        responses = [response]
+
+        link_header = response.headers.get('Link', '')
+        last_match = _LAST_LINK_RE.search(link_header)
+        last_page = _PAGE_PARAM_RE.search(last_match.group(1)) if last_match else None
+
+        if concurrent and last_page:
+            # All page URLs are known up front, so fetch them in parallel.
+            # executor.map() yields results in submission order.
+            page_urls = [_page_url(url, page) for page in range(2, int(last_page.group(1)) + 1)]
+            with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+                responses.extend(executor.map(get_page, page_urls))
+            return responses
+
+        # No rel="last" link: follow rel="next" links one page at a time
+        while True:
+            # Check for next page in Link header
+            # Format: <https://3.basecampapi.com/.../projects.json?page=2>; rel="next"
+            next_match = _NEXT_LINK_RE.search(response.headers.get('Link', ''))
+            if not next_match:
+                # No Link header (or no next link) means this is the last page
+                break
+
+            response = get_page(next_match.group(1))
+            responses.append(response)
+
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Error fetching data from Basecamp: {str(e)}")
+
+    return responses
+
+
+def _join_page_items(responses: list) -> bytes:
+    """
+    Join the items of every page response into one comma-separated byte string.
+
+    Each page body is a JSON array; its brackets are stripped so the pages
+    can be joined without decoding them. A page holding a single object is
+    kept whole.
+
+    Args:
+        responses: Page responses from fetch_page_responses()
+
+    Returns:
+        Comma-separated JSON items as bytes
+    """
+    chunks = []
+    for response in responses:
+        body = response.content.strip()
+        if body.startswith(b'['):
+            body = body[1:-1].strip()
+        if body:
+            chunks.append(body)
+
+    # bytes.join sizes the result once instead of growing it page by page
+    return b','.join(chunks)
+
+
+# One simdjson parser per thread; parsers are reused but not thread-safe
+_SIMDJSON_PARSERS = threading.local()
+
+
+def _count_page_items(body: bytes) -> int:
+    """
+    Count the items in one page body without building Python objects.
+
+    Uses pysimdjson's lazy parser when it is installed, otherwise orjson.
+
+    Args:
+        body: Raw JSON body of one page
+
+    Returns:
+        Number of items on the page (1 if the page is a single object)
+    """
+    if simdjson is not None:
+        parser = getattr(_SIMDJSON_PARSERS, "parser", None)
+        if parser is None:
+            parser = _SIMDJSON_PARSERS.parser = simdjson.Parser()
+        doc = parser.parse(body)
+        return len(doc) if isinstance(doc, simdjson.Array) else 1
+
+    page_items = orjson.loads(body)
+    return len(page_items) if isinstance(page_items, list) else 1
+
+
+def fetch_all_pages(url: str, concurrent: bool = True) -> list:
+    """
+    Fetch all pages of a paginated Basecamp API endpoint.
+
+    The raw pages are joined into a single JSON array and decoded once,
+    rather than decoding each page and extending a list.
+
+    Args:
+        url: The initial API endpoint URL
+        concurrent: Set to False to fetch pages one by one
+                    (see fetch_page_responses)
 
     Returns:
         List of all items from all pages combined
     """
-    all_items = []
-    current_url = url
-    headers = get_basecamp_headers()
+    return orjson.loads(b'[%s]' % _join_page_items(fetch_page_responses(url, concurrent)))
+
+
+def fetch_all_pages_raw(url: str) -> tuple:
+    """
+    Fetch all pages of a paginated Basecamp API endpoint without decoding them.
 
-    while current_url:
-        try:
-            response = requests.get(current_url, headers=headers, timeout=30)
-            response.raise_for_status()
+    The pages are joined by _join_page_items(), ready to be spliced into a
+    response by _envelope(). The items of each page are counted by
+    _count_page_items(), so the count always matches the joined items.
 
-            # Add items from current page
-            page_items = response.json()
-            if isinstance(page_items, list):
-                all_items.extend(page_items)
-            else:
-                # If single item returned, add it
-                all_items.append(page_items)
+    Args:
+        url: The initial API endpoint URL
 
-            # Check for next page in Link header
-            link_header = response.headers.get('Link', '')
-            if link_header:
-                # Parse Link header for next page URL
-                # Format: <https://3.basecampapi.com/.../projects.json?page=2>; rel="next"
-                parts = link_header.split(';')
-                if len(parts) >= 2 and 'rel="next"' in parts[1]:
-                    # Extract URL from <...>
-                    next_url = parts[0].strip()[1:-1]  # Remove < and >
-                    current_url = next_url
-                else:
-                    # No next page
-                    current_url = None
-            else:
-                # No Link header means this is the last page
-                current_url = None
-
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Error fetching data from Basecamp: {str(e)}")
-
-    return all_items
+    Returns:
+        Tuple of (comma-separated JSON items as bytes, total item count)
+    """
+    responses = fetch_page_responses(url)
+    count = sum(_count_page_items(response.content) for response in responses)
+
+    return _join_page_items(responses), count
+
+
+def _envelope(fields: dict, key: str, raw_items: bytes) -> str:
+    """
+    Build a tool response around pre-encoded list items.
+
+    Args:
+        fields: Leading response fields (totals and filters)
+        key: Name of the list field that holds the items
+        raw_items: Comma-separated JSON items from fetch_all_pages_raw()
+
+    Returns:
+        JSON string with the fields followed by key: [items]
+    """
+    head = orjson.dumps(fields)[:-1]  # Drop the closing brace
+    return _dump_raw(b'%s,"%s":[%s]}' % (head, key.encode(), raw_items))
+
+
+def run_in_thread(fn):
+    """
+    Turn a blocking tool or resource function into an async one.
+
+    The Basecamp calls are made with the blocking requests SESSION, so the
+    wrapped function runs in a worker thread. Concurrent MCP tool calls then
+    wait on the network in parallel instead of blocking the event loop.
+
+    Args:
+        fn: The blocking function to wrap
+
+    Returns:
+        Async function with the same name, signature and docstring
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
 
 
 @mcp.tool()
+@run_in_thread
 def list_projects(status: Optional[str] = None) -> str:
     """
     List all active projects visible to the current user.
@@ -261,27 +762,24 @@ def list_projects(status: Optional[str] = None) -> str:
     """
     try:
         # Build URL with optional status parameter
-        url = f"{BASECAMP_API_BASE_URL}/projects.json"
+        url = _PROJECTS_URL
         if status:
             url += f"?status={status}"
 
-        # Fetch all pages
-        projects = fetch_all_pages(url)
+        # Fetch all pages as raw JSON and splice them into the response
+        projects, total = fetch_all_pages_raw(url)
 
-        # Format response
-        response = {
-            "total_projects": len(projects),
-            "status_filter": status or "active",
-            "projects": projects
-        }
-
-        return json.dumps(response, indent=2)
+        return _envelope({
+            "total_projects": total,
+            "status_filter": status or "active"
+        }, "projects", projects)
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_project(project_id: int) -> str:
     """
     Get detailed information for a specific project.
@@ -299,30 +797,25 @@ def get_project(project_id: int) -> str:
         - URLs for API and web access
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/projects/{project_id}.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        project_data = response.json()
-
-        return json.dumps(project_data, indent=2)
+        url = _PROJECT_URL.format(project_id=project_id)
+        # Pass the API's JSON through as-is
+        return _dump_raw(cached_get(url))
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"Project with ID {project_id} not found"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}"
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_todoset(bucket_id: int, todoset_id: int) -> str:
     """
     Get a to-do set from a project.
@@ -348,30 +841,25 @@ def get_todoset(bucket_id: int, todoset_id: int) -> str:
         - Creator information
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todosets/{todoset_id}.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        todoset_data = response.json()
-
-        return json.dumps(todoset_data, indent=2)
+        url = _TODOSET_URL.format(bucket_id=bucket_id, todoset_id=todoset_id)
+        # Pass the API's JSON through as-is
+        return _dump_raw(cached_get(url))
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"To-do set with ID {todoset_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}"
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_todolists(bucket_id: int, todoset_id: int, status: Optional[str] = None) -> str:
     """
     Get all to-do lists from a to-do set.
@@ -396,29 +884,26 @@ def get_todolists(bucket_id: int, todoset_id: int, status: Optional[str] = None)
     """
     try:
         # Build URL with optional status parameter
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todosets/{todoset_id}/todolists.json"
+        url = _TODOLISTS_URL.format(bucket_id=bucket_id, todoset_id=todoset_id)
         if status:
             url += f"?status={status}"
 
-        # Fetch all pages
-        todolists = fetch_all_pages(url)
+        # Fetch all pages as raw JSON and splice them into the response
+        todolists, total = fetch_all_pages_raw(url)
 
-        # Format response
-        response = {
-            "total_todolists": len(todolists),
+        return _envelope({
+            "total_todolists": total,
             "bucket_id": bucket_id,
             "todoset_id": todoset_id,
-            "status_filter": status or "active",
-            "todolists": todolists
-        }
-
-        return json.dumps(response, indent=2)
+            "status_filter": status or "active"
+        }, "todolists", todolists)
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_todolist(bucket_id: int, todolist_id: int) -> str:
     """
     Get a single to-do list with complete details.
@@ -441,30 +926,25 @@ def get_todolist(bucket_id: int, todolist_id: int) -> str:
         - URLs for accessing todos and groups within this list
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todolists/{todolist_id}.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        todolist_data = response.json()
-
-        return json.dumps(todolist_data, indent=2)
+        url = _TODOLIST_URL.format(bucket_id=bucket_id, todolist_id=todolist_id)
+        # Pass the API's JSON through as-is
+        return _dump_raw(cached_get(url))
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"To-do list with ID {todolist_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}"
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_todos(bucket_id: int, todolist_id: int, status: Optional[str] = None, completed: Optional[bool] = None) -> str:
     """
     Get all to-dos from a to-do list.
@@ -492,7 +972,7 @@ def get_todos(bucket_id: int, todolist_id: int, status: Optional[str] = None, co
     """
     try:
         # Build URL with optional query parameters
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todolists/{todolist_id}/todos.json"
+        url = _TODOS_URL.format(bucket_id=bucket_id, todolist_id=todolist_id)
         params = []
         if status:
             params.append(f"status={status}")
@@ -502,26 +982,23 @@ def get_todos(bucket_id: int, todolist_id: int, status: Optional[str] = None, co
         if params:
             url += "?" + "&".join(params)
 
-        # Fetch all pages
-        todos = fetch_all_pages(url)
+        # Fetch all pages as raw JSON and splice them into the response
+        todos, total = fetch_all_pages_raw(url)
 
-        # Format response
-        response = {
-            "total_todos": len(todos),
+        return _envelope({
+            "total_todos": total,
             "bucket_id": bucket_id,
             "todolist_id": todolist_id,
             "status_filter": status or "active",
-            "completed_filter": completed if completed is not None else "all pending",
-            "todos": todos
-        }
-
-        return json.dumps(response, indent=2)
+            "completed_filter": completed if completed is not None else "all pending"
+        }, "todos", todos)
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_todo(bucket_id: int, todo_id: int) -> str:
     """
     Get a single to-do with complete details.
@@ -546,30 +1023,103 @@ def get_todo(bucket_id: int, todo_id: int) -> str:
         - URLs for completion and modification actions
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todos/{todo_id}.json"
-        headers = get_basecamp_headers()
+        url = _TODO_URL.format(bucket_id=bucket_id, todo_id=todo_id)
+        # Pass the API's JSON through as-is
+        return _dump_raw(cached_get(url))
 
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 404:
+            return _dump({
+                "error": f"To-do with ID {todo_id} not found in bucket {bucket_id}"
+            })
+        else:
+            return _dump({
+                "error": f"HTTP error: {str(e)}"
+            })
+    except Exception as e:
+        return _dump({"error": str(e)})
+
+
+@mcp.tool()
+async def get_project_tree(project_id: int) -> str:
+    """
+    Get a project with all of its to-do sets, to-do lists and to-dos in one call.
+
+    Replaces the usual get_project -> get_todoset -> get_todolists -> get_todos
+    chain. Once the project is fetched, the to-do sets in its dock are fetched
+    concurrently, then all of their to-do lists, then the to-dos of every list.
+
+    Args:
+        project_id: The ID of the project to retrieve
+
+    Returns:
+        JSON string containing:
+        - project: The project details, including the dock
+        - todosets: Each enabled to-do set from the dock, with a "todolists"
+          array; each to-do list has a "todos" array of its active, pending to-dos
+    """
+    # At most FETCH_MAX_WORKERS requests are in flight for the whole walk:
+    # each fetch holds a slot, and paginated fetches walk their pages one by
+    # one instead of opening their own thread pool.
+    limit = asyncio.Semaphore(FETCH_MAX_WORKERS)
 
-        todo_data = response.json()
+    async def fetch(fn, *args):
+        async with limit:
+            return await asyncio.to_thread(fn, *args)
 
-        return json.dumps(todo_data, indent=2)
+    try:
+        project = orjson.loads(await fetch(cached_get, _PROJECT_URL.format(project_id=project_id)))
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
-                "error": f"To-do with ID {todo_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            return _dump({
+                "error": f"Project with ID {project_id} not found"
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}"
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
+
+    try:
+        todoset_urls = [
+            tool["url"] for tool in project.get("dock", [])
+            if tool.get("name") == "todoset" and tool.get("enabled")
+        ]
+        todosets = [
+            orjson.loads(body)
+            for body in await asyncio.gather(*(fetch(cached_get, url) for url in todoset_urls))
+        ]
+
+        todolists_by_set = await asyncio.gather(
+            *(fetch(fetch_all_pages, todoset["todolists_url"], False) for todoset in todosets)
+        )
+        for todoset, todolists in zip(todosets, todolists_by_set):
+            todoset["todolists"] = todolists
+
+        all_todolists = [todolist for todoset in todosets for todolist in todoset["todolists"]]
+        todos_by_list = await asyncio.gather(
+            *(fetch(fetch_all_pages, todolist["todos_url"], False) for todolist in all_todolists)
+        )
+        for todolist, todos in zip(all_todolists, todos_by_list):
+            todolist["todos"] = todos
+
+        return _dump({
+            "project": project,
+            "todosets": todosets
+        })
+
+    except requests.exceptions.HTTPError as e:
+        return _dump({
+            "error": f"HTTP error: {str(e)}"
+        })
+    except Exception as e:
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def create_todo(
     bucket_id: int,
     todolist_id: int,
@@ -599,52 +1149,45 @@ def create_todo(
         JSON string containing the created to-do object with status 201 Created
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todolists/{todolist_id}/todos.json"
-        headers = get_basecamp_headers()
+        url = _TODOS_URL.format(bucket_id=bucket_id, todolist_id=todolist_id)
 
         # Build request body
-        payload = {
-            "content": content
-        }
-
-        if description:
-            payload["description"] = description
-        if assignee_ids:
-            payload["assignee_ids"] = assignee_ids
-        if completion_subscriber_ids:
-            payload["completion_subscriber_ids"] = completion_subscriber_ids
-        if notify is not None:
-            payload["notify"] = notify
-        if due_on:
-            payload["due_on"] = due_on
-        if starts_on:
-            payload["starts_on"] = starts_on
-
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        payload = {"content": content, **{k: v for k, v in (
+            ("description", description),
+            ("assignee_ids", assignee_ids),
+            ("completion_subscriber_ids", completion_subscriber_ids),
+            ("notify", notify),
+            ("due_on", due_on),
+            ("starts_on", starts_on)
+        ) if v is not None}}
+
+        response = basecamp_request("POST", url, payload=payload)
         response.raise_for_status()
+        invalidate_cached(_TODOLIST_URL.format(bucket_id=bucket_id, todolist_id=todolist_id))
 
-        todo_data = response.json()
+        todo_data = orjson.loads(response.content)
 
-        return json.dumps({
+        return _dump({
             "status": "created",
             "todo": todo_data
-        }, indent=2)
+        })
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"To-do list with ID {todolist_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}",
                 "details": e.response.text if hasattr(e, 'response') else None
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def update_todo(
     bucket_id: int,
     todo_id: int,
@@ -678,52 +1221,52 @@ def update_todo(
         JSON string containing the updated to-do object with status 200 OK
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todos/{todo_id}.json"
-        headers = get_basecamp_headers()
+        url = _TODO_URL.format(bucket_id=bucket_id, todo_id=todo_id)
 
         # Build request body
-        payload = {
-            "content": content
-        }
-
-        if description is not None:
-            payload["description"] = description
-        if assignee_ids is not None:
-            payload["assignee_ids"] = assignee_ids
-        if completion_subscriber_ids is not None:
-            payload["completion_subscriber_ids"] = completion_subscriber_ids
-        if notify is not None:
-            payload["notify"] = notify
-        if due_on is not None:
-            payload["due_on"] = due_on
-        if starts_on is not None:
-            payload["starts_on"] = starts_on
-
-        response = requests.put(url, headers=headers, json=payload, timeout=30)
+        payload = {"content": content, **{k: v for k, v in (
+            ("description", description),
+            ("assignee_ids", assignee_ids),
+            ("completion_subscriber_ids", completion_subscriber_ids),
+            ("notify", notify),
+            ("due_on", due_on),
+            ("starts_on", starts_on)
+        ) if v is not None}}
+
+        response = basecamp_request("PUT", url, payload=payload)
         response.raise_for_status()
 
-        todo_data = response.json()
+        todo_data = orjson.loads(response.content)
 
-        return json.dumps({
+        # The parent list's cached details may include this to-do's changes
+        parent_id = (todo_data.get("parent") or {}).get("id")
+        if parent_id:
+            invalidate_cached(url, _TODOLIST_URL.format(bucket_id=bucket_id, todolist_id=parent_id))
+        else:
+            invalidate_cached(url)
+            invalidate_cached_prefix(_BUCKET_TODOLISTS_PREFIX.format(bucket_id=bucket_id))
+
+        return _dump({
             "status": "updated",
             "todo": todo_data
-        }, indent=2)
+        })
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"To-do with ID {todo_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}",
                 "details": e.response.text if hasattr(e, 'response') else None
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def complete_todo(bucket_id: int, todo_id: int) -> str:
     """
     Mark a to-do as completed.
@@ -739,32 +1282,36 @@ def complete_todo(bucket_id: int, todo_id: int) -> str:
         JSON string with completion confirmation
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todos/{todo_id}/completion.json"
-        headers = get_basecamp_headers()
-
-        response = requests.post(url, headers=headers, timeout=30)
+        url = _TODO_COMPLETION_URL.format(bucket_id=bucket_id, todo_id=todo_id)
+        response = basecamp_request("POST", url)
         response.raise_for_status()
 
-        return json.dumps({
+        # The response has no body, so the parent list is unknown: drop every
+        # cached to-do list in the bucket, as their completion data changed
+        invalidate_cached(_TODO_URL.format(bucket_id=bucket_id, todo_id=todo_id))
+        invalidate_cached_prefix(_BUCKET_TODOLISTS_PREFIX.format(bucket_id=bucket_id))
+
+        return _dump({
             "status": "completed",
             "message": f"To-do {todo_id} has been marked as complete"
-        }, indent=2)
+        })
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"To-do with ID {todo_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}",
                 "details": e.response.text if hasattr(e, 'response') else None
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_people() -> str:
     """
     Get all people visible to the current user.
@@ -783,13 +1330,11 @@ def get_people() -> str:
         - attachable_sgid for use in assignments
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/people.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
+        url = _PEOPLE_URL
+        response = basecamp_request("GET", url)
         response.raise_for_status()
 
-        people_data = response.json()
+        people_data = orjson.loads(response.content)
 
         # Format response
         result = {
@@ -797,13 +1342,14 @@ def get_people() -> str:
             "people": people_data
         }
 
-        return json.dumps(result, indent=2)
+        return _dump(result)
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def uncomplete_todo(bucket_id: int, todo_id: int) -> str:
     """
     Mark a to-do as uncompleted (reopen it).
@@ -818,32 +1364,36 @@ def uncomplete_todo(bucket_id: int, todo_id: int) -> str:
         JSON string with uncompletion confirmation
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todos/{todo_id}/completion.json"
-        headers = get_basecamp_headers()
-
-        response = requests.delete(url, headers=headers, timeout=30)
+        url = _TODO_COMPLETION_URL.format(bucket_id=bucket_id, todo_id=todo_id)
+        response = basecamp_request("DELETE", url)
         response.raise_for_status()
 
-        return json.dumps({
+        # The response has no body, so the parent list is unknown: drop every
+        # cached to-do list in the bucket, as their completion data changed
+        invalidate_cached(_TODO_URL.format(bucket_id=bucket_id, todo_id=todo_id))
+        invalidate_cached_prefix(_BUCKET_TODOLISTS_PREFIX.format(bucket_id=bucket_id))
+
+        return _dump({
             "status": "uncompleted",
             "message": f"To-do {todo_id} has been marked as incomplete"
-        }, indent=2)
+        })
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"To-do with ID {todo_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}",
                 "details": e.response.text if hasattr(e, 'response') else None
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_comments(bucket_id: int, recording_id: int) -> str:
     """
     Get all comments on a recording (resource).
@@ -866,26 +1416,23 @@ def get_comments(bucket_id: int, recording_id: int) -> str:
         - Visibility status for clients
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/recordings/{recording_id}/comments.json"
+        url = _COMMENTS_URL.format(bucket_id=bucket_id, recording_id=recording_id)
 
-        # Fetch all pages
-        comments = fetch_all_pages(url)
+        # Fetch all pages as raw JSON and splice them into the response
+        comments, total = fetch_all_pages_raw(url)
 
-        # Format response
-        response = {
-            "total_comments": len(comments),
+        return _envelope({
+            "total_comments": total,
             "bucket_id": bucket_id,
-            "recording_id": recording_id,
-            "comments": comments
-        }
-
-        return json.dumps(response, indent=2)
+            "recording_id": recording_id
+        }, "comments", comments)
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def get_comment(bucket_id: int, comment_id: int) -> str:
     """
     Get a single comment with complete details.
@@ -907,31 +1454,29 @@ def get_comment(bucket_id: int, comment_id: int) -> str:
         - Visibility status for clients
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/comments/{comment_id}.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
+        url = _COMMENT_URL.format(bucket_id=bucket_id, comment_id=comment_id)
+        response = basecamp_request("GET", url)
         response.raise_for_status()
 
-        comment_data = response.json()
-
-        return json.dumps(comment_data, indent=2)
+        # Pass the API's JSON through as-is
+        return _dump_raw(response.content)
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"Comment with ID {comment_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}",
                 "details": e.response.text if hasattr(e, 'response') else None
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def create_comment(bucket_id: int, recording_id: int, content: str) -> str:
     """
     Create a new comment on a recording (resource).
@@ -950,39 +1495,39 @@ def create_comment(bucket_id: int, recording_id: int, content: str) -> str:
         timestamps, creator information, and formatted content.
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/recordings/{recording_id}/comments.json"
-        headers = get_basecamp_headers()
+        url = _COMMENTS_URL.format(bucket_id=bucket_id, recording_id=recording_id)
 
         # Build request body
         payload = {
             "content": content
         }
 
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = basecamp_request("POST", url, payload=payload)
         response.raise_for_status()
 
-        comment_data = response.json()
+        comment_data = orjson.loads(response.content)
 
-        return json.dumps({
+        return _dump({
             "status": "created",
             "comment": comment_data
-        }, indent=2)
+        })
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"Recording with ID {recording_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}",
                 "details": e.response.text if hasattr(e, 'response') else None
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 @mcp.tool()
+@run_in_thread
 def update_comment(bucket_id: int, comment_id: int, content: str) -> str:
     """
     Update an existing comment's content.
@@ -1001,36 +1546,35 @@ def update_comment(bucket_id: int, comment_id: int, content: str) -> str:
         updated timestamp.
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/comments/{comment_id}.json"
-        headers = get_basecamp_headers()
+        url = _COMMENT_URL.format(bucket_id=bucket_id, comment_id=comment_id)
 
         # Build request body
         payload = {
             "content": content
         }
 
-        response = requests.put(url, headers=headers, json=payload, timeout=30)
+        response = basecamp_request("PUT", url, payload=payload)
         response.raise_for_status()
 
-        comment_data = response.json()
+        comment_data = orjson.loads(response.content)
 
-        return json.dumps({
+        return _dump({
             "status": "updated",
             "comment": comment_data
-        }, indent=2)
+        })
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            return json.dumps({
+            return _dump({
                 "error": f"Comment with ID {comment_id} not found in bucket {bucket_id}"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dump({
                 "error": f"HTTP error: {str(e)}",
                 "details": e.response.text if hasattr(e, 'response') else None
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 # ============================================================================
@@ -1051,6 +1595,7 @@ if PROJECTS_FILE.exists():
 
 
 @mcp.resource("basecamp://projects/live")
+@run_in_thread
 def get_live_projects() -> dict:
     """
     Live Basecamp projects list fetched from the API.
@@ -1059,7 +1604,7 @@ def get_live_projects() -> dict:
     including full project details with id, name, and description.
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/projects.json"
+        url = _PROJECTS_URL
         projects = fetch_all_pages(url)
 
         return {
@@ -1077,6 +1622,7 @@ def get_live_projects() -> dict:
 
 
 @mcp.resource("basecamp://project/{project_id}")
+@run_in_thread
 def get_project_resource(project_id: str) -> dict:
     """
     Get detailed information for a specific project by ID.
@@ -1088,13 +1634,8 @@ def get_project_resource(project_id: str) -> dict:
         project_id: The ID of the project to retrieve
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/projects/{project_id}.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        return response.json()
+        url = _PROJECT_URL.format(project_id=project_id)
+        return orjson.loads(cached_get(url))
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
             return {"error": f"Project with ID {project_id} not found"}
@@ -1105,6 +1646,7 @@ def get_project_resource(project_id: str) -> dict:
 
 
 @mcp.resource("basecamp://people")
+@run_in_thread
 def get_people_resource() -> dict:
     """
     Get all people in the Basecamp account.
@@ -1113,13 +1655,11 @@ def get_people_resource() -> dict:
     including employees, clients, and administrators.
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/people.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
+        url = _PEOPLE_URL
+        response = basecamp_request("GET", url)
         response.raise_for_status()
 
-        people_data = response.json()
+        people_data = orjson.loads(response.content)
 
         return {
             "total_people": len(people_data),
@@ -1130,6 +1670,7 @@ def get_people_resource() -> dict:
 
 
 @mcp.resource("basecamp://todolist/{bucket_id}/{todolist_id}")
+@run_in_thread
 def get_todolist_resource(bucket_id: str, todolist_id: str) -> dict:
     """
     Get a specific to-do list with complete details.
@@ -1139,13 +1680,8 @@ def get_todolist_resource(bucket_id: str, todolist_id: str) -> dict:
         todolist_id: The ID of the to-do list
     """
     try:
-        url = f"{BASECAMP_API_BASE_URL}/buckets/{bucket_id}/todolists/{todolist_id}.json"
-        headers = get_basecamp_headers()
-
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        return response.json()
+        url = _TODOLIST_URL.format(bucket_id=bucket_id, todolist_id=todolist_id)
+        return orjson.loads(cached_get(url))
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
             return {